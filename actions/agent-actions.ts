@@ -38,10 +38,26 @@ function getEnvVar(name: string): string {
 const PROMPTLAYER_API_KEY = getEnvVar("PROMPTLAYER_API_KEY")
 const PROMPTLAYER_CALLBACK_URL = getEnvVar("PROMPTLAYER_CALLBACK_URL")
 const PROMPTLAYER_API_URL = getEnvVar("PROMPTLAYER_API_URL")
+const PROMPTLAYER_RUN_URL = `${PROMPTLAYER_API_URL}/workflows/Master_Agent_V1/run`
+const PROMPTLAYER_HEADERS = {
+  "X-API-KEY": PROMPTLAYER_API_KEY,
+  "Content-Type": "application/json"
+}
+const REQUEST_TIMEOUT_MS = 30_000
+
+/* Workflow label to run for each supported STAR example count */
+const WORKFLOW_VERSIONS: Record<number, string> = {
+  2: "v1.2",
+  3: "v1.3",
+  4: "v1.4"
+}
 
 export async function generateAgentPitchAction(
   pitchData: GenerateAgentPitchParams
 ): Promise<ActionState<string>> {
+  const controller = new AbortController()
+  const timeoutId = setTimeout(() => controller.abort(), REQUEST_TIMEOUT_MS)
+
   try {
     const {
       roleName,
@@ -108,12 +124,7 @@ export async function generateAgentPitchAction(
       100000 + Math.random() * 900000
     ).toString()
 
-    const workflowVersion =
-      {
-        2: "v1.2",
-        3: "v1.3",
-        4: "v1.4"
-      }[numExamples] ?? "v1.2"
+    const workflowVersion = WORKFLOW_VERSIONS[numExamples] ?? "v1.2"
 
     /* Calculate word limits - only STAR examples increased by 8% to compensate for agent under-generation */
     const introWordCount = Math.round(pitchWordLimit * 0.1)
@@ -138,17 +149,12 @@ export async function generateAgentPitchAction(
     }
 
     /* Make request to PromptLayer */
-    const res = await fetch(
-      `${PROMPTLAYER_API_URL}/workflows/Master_Agent_V1/run`,
-      {
-        method: "POST",
-        headers: {
-          "X-API-KEY": PROMPTLAYER_API_KEY,
-          "Content-Type": "application/json"
-        },
-        body: JSON.stringify(body)
-      }
-    )
+    const res = await fetch(PROMPTLAYER_RUN_URL, {
+      method: "POST",
+      headers: PROMPTLAYER_HEADERS,
+      body: JSON.stringify(body),
+      signal: controller.signal
+    })
 
     if (!res.ok) {
       const errorText = await res.text()
@@ -168,10 +174,18 @@ export async function generateAgentPitchAction(
       data: agentExecutionId
     }
   } catch (err: any) {
+    if (err?.name === "AbortError") {
+      return {
+        isSuccess: false,
+        message: "PromptLayer request timed out"
+      }
+    }
     console.error("generateAgentPitchAction error:", err)
     return {
       isSuccess: false,
       message: err.message || "Unknown error while contacting PromptLayer"
     }
+  } finally {
+    clearTimeout(timeoutId)
   }
 }
@@ -73,6 +73,16 @@ export async function checkPitchGenerationStatus(
       throw new Error(errorData.error || `Error: ${response.status}`)
     }
 
+    // The status route answers 202 while the pitch is pending, so skip
+    // reading and parsing the body for in-progress polls
+    if (response.status === 202) {
+      void response.body?.cancel()
+      return {
+        isSuccess: false,
+        message: "Pitch still processing"
+      }
+    }
+
     const data = await response.json()
 
     if (data.status === "completed") {